@@ -37,14 +37,95 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import mmap
 import re
 import sys
 import os
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import tkinter as tk
-from tkinter import filedialog
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+import numpy as np
+
+# matplotlib and tkinter imports are deferred: importing pyplot triggers
+# backend selection and loading a GUI toolkit can take hundreds of ms, so
+# scripted usage (LogReader with an explicit path, no plots) pays for
+# neither. See _get_pyplot() and choose_file().
+_plt = None
+_mdates = None
+
+
+def _get_pyplot():
+    """
+    Imports matplotlib on first use and returns (pyplot, dates).
+
+    On a headless machine (no display, no explicit backend choice) the
+    Agg raster backend is selected: it renders these static figures
+    faster than the GUI backends and works without a display server.
+    Figures are then saved next to the log file instead of shown.
+    """
+    global _plt, _mdates
+    if _plt is None:
+        import matplotlib
+        if os.name != 'nt' and not os.environ.get('DISPLAY') and not os.environ.get('MPLBACKEND'):
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+
+        # Rendering hints: let matplotlib collapse near-collinear points
+        # and split very long paths into chunks instead of processing
+        # them in one O(N) go.
+        plt.rcParams['path.simplify'] = True
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        plt.rcParams['agg.path.chunksize'] = 10000
+        _plt, _mdates = plt, mdates
+    return _plt, _mdates
+
+# pandas is optional: when present, parse_log uses a vectorized bulk path
+# that keeps the regex loop and numeric conversions in C. Without it, the
+# line-by-line parser below is used instead.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# tsdownsample is optional: when present, plots are downsampled with LTTB
+# (Largest-Triangle-Three-Buckets); otherwise a NumPy M4 aggregation
+# (first/last/min/max per pixel bin) is used instead.
+try:
+    from tsdownsample import LTTBDownsampler
+except ImportError:
+    LTTBDownsampler = None
+
+
+class LogRecord:
+    """
+    Slot-based record handed out by LogReader.detailed_logs.
+
+    A __slots__ class stores its eleven fields in fixed slots instead of
+    a per-instance dict, which is both markedly smaller and faster to
+    populate when a large log is materialized. Fields are read as
+    attributes (record.jitter); item access (record['jitter']) is kept
+    for code written against the historical dict records.
+    """
+    __slots__ = ('timestamp', 'packet_loss', 'sent', 'received', 'lost',
+                 'min', 'max', 'avg', 'jitter', 'duration', 'ping_results')
+
+    def __init__(self, timestamp, packet_loss, sent, received, lost,
+                 min_ping, max_ping, avg, jitter, duration, ping_results):
+        self.timestamp = timestamp
+        self.packet_loss = packet_loss
+        self.sent = sent
+        self.received = received
+        self.lost = lost
+        self.min = min_ping
+        self.max = max_ping
+        self.avg = avg
+        self.jitter = jitter
+        self.duration = duration
+        self.ping_results = ping_results
+
+    def __getitem__(self, key):
+        return getattr(self, key)
 
 
 class LogReader:
@@ -66,14 +147,33 @@ class LogReader:
     
     # Pre-compile regex pattern for parsing log entries
     # Format: timestamp - status: loss% (stats) Min/Max/Avg | Jitter/Duration | Results
+    # The pattern is written to avoid backtracking in CPython's regex engine:
+    # floats use the unambiguous \d+(?:\.\d+)? instead of [\d.]+, the ping
+    # results use a negated class instead of a lazy .*?, and re.ASCII keeps
+    # \d as plain [0-9]. re.match is already start-anchored, so no ^/$ needed.
     LOG_PATTERN = re.compile(
-        r'^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+) - '
-        r'Connected: (?P<packet_loss>[\d.]+)% packet loss '
+        r'(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+) - '
+        r'Connected: (?P<packet_loss>\d+(?:\.\d+)?)% packet loss '
         r'\(Sent: (?P<sent>\d+), Received: (?P<received>\d+), Lost: (?P<lost>\d+)\) '
         r'Min: (?P<min>\d+)ms, Max: (?P<max>\d+)ms, Avg: (?P<avg>\d+)ms \| '
-        r'Jitter: (?P<jitter>[\d.]+)ms, Duration: (?P<duration>[\d.]+)ms \| '
-        r'Ping Results: \[(?P<ping_results>.*?)\]$'
+        r'Jitter: (?P<jitter>\d+(?:\.\d+)?)ms, Duration: (?P<duration>\d+(?:\.\d+)?)ms \| '
+        r'Ping Results: \[(?P<ping_results>[^\]]*)\]',
+        re.ASCII
     )
+
+    # Bytes twin of LOG_PATTERN, used by the mmap-based line parser so log
+    # data never has to be decoded to str just to be matched.
+    LOG_PATTERN_BYTES = re.compile(LOG_PATTERN.pattern.encode('ascii'), re.ASCII)
+
+    # Splits the mmap'd file into lines in one finditer sweep: the C regex
+    # engine advances through the buffer internally, so there is no
+    # per-line readline() call and no strip() (\r and \n are excluded from
+    # the match itself). Each match also carries the line's byte span.
+    LINE_SPLIT_PATTERN = re.compile(rb'[^\r\n]+')
+
+    # Files at least this large are parsed by multiple worker processes;
+    # below it the fork/spawn overhead outweighs the parallel speedup.
+    PARALLEL_MIN_BYTES = 64 * 1024 * 1024
     
     def __init__(self, log_file_path=None):
         """
@@ -91,16 +191,138 @@ class LogReader:
             print("No file selected. Exiting.")
             sys.exit(1)
             
-        # Initialize data containers
-        self.timestamps = []
+        # Initialize data containers. Timestamps are kept as
+        # np.datetime64[us] so gap detection, duration maths and the
+        # sample cutoff all run as native integer arithmetic instead of
+        # per-object datetime calls.
+        self.timestamps = np.empty(0, 'datetime64[us]')
         self.packet_losses = []
         self.avg_pings = []
         self.jitters = []
-        self.detailed_logs = []
         self.segments = []
+        # Duration in seconds of each entry in self.segments, precomputed
+        # by chunk_data so filter_segments never touches datetime objects.
+        self._segment_durations = np.empty(0, np.int64)
+
+        # Per-record metric columns in SoA (structure-of-arrays) layout.
+        # Ping results are stored as one flat int32 array with timeouts
+        # encoded as -1, plus CSR-style offsets marking each record's slice:
+        # record i owns _ping_flat[_ping_offsets[i]:_ping_offsets[i + 1]].
+        self._sent = np.empty(0, np.int32)
+        self._received = np.empty(0, np.int32)
+        self._lost = np.empty(0, np.int32)
+        self._min_pings = np.empty(0, np.int32)
+        self._max_pings = np.empty(0, np.int32)
+        self._durations = np.empty(0, np.float64)
+        self._ping_flat = np.empty(0, np.int32)
+        self._ping_offsets = np.zeros(1, np.int64)
+
+        # Raw text of every successfully parsed line (bulk path), or its
+        # (byte offset, length) span in the file (mmap line path), kept so
+        # that generate_sample can slice its excerpt without re-reading
+        # and re-matching the whole file a second time. Spans cost two
+        # ints per line instead of a copy of the line itself.
+        self._raw_lines = []
+        self._line_spans = []
         
         self.parse_log()
 
+    # Ordered (field, terminating delimiter) pairs describing the fixed
+    # log-entry layout after the ' - Connected: ' marker. Used by
+    # _parse_line_fast to slice values out with bytes.find instead of regex.
+    _FAST_FIELDS = (
+        ('packet_loss', b'% packet loss (Sent: '),
+        ('sent', b', Received: '),
+        ('received', b', Lost: '),
+        ('lost', b') Min: '),
+        ('min', b'ms, Max: '),
+        ('max', b'ms, Avg: '),
+        ('avg', b'ms | Jitter: '),
+        ('jitter', b'ms, Duration: '),
+        ('duration', b'ms | Ping Results: ['),
+        ('ping_results', b']'),
+    )
+
+    @classmethod
+    def _parse_line_fast(cls, line, marker_idx):
+        """
+        Parses a raw log line by walking its fixed delimiters with
+        bytes.find and slicing the values in between, avoiding the regex
+        engine entirely. The delimiters are literal substrings, so each
+        field is located by a plain C-level scan.
+
+        Args:
+            line (bytes): The undecoded log line to parse
+            marker_idx (int): Index of b' - Connected: ' in the line
+                              (already located by the caller's prefilter)
+
+        Returns:
+            dict: Field name -> bytes substring mapping matching
+                  LOG_PATTERN_BYTES' groupdict(), or None if the line
+                  deviates from the fixed layout (caller falls back to the
+                  regex). int()/float() accept the bytes values directly.
+        """
+        data = {'timestamp': line[:marker_idx]}
+        pos = marker_idx + len(b' - Connected: ')
+        find = line.find
+        for name, delim in cls._FAST_FIELDS:
+            end = find(delim, pos)
+            if end < 0:
+                return None
+            data[name] = line[pos:end]
+            pos = end + len(delim)
+        return data
+
+    @classmethod
+    def _parse_entry(cls, line, marker_idx):
+        """
+        Parses one prefiltered log line into a flat tuple of scalars.
+
+        Shared by the serial parser and the parallel chunk workers so the
+        field extraction logic lives in exactly one place.
+
+        Args:
+            line (bytes): The undecoded log line
+            marker_idx (int): Index of b' - Connected: ' in the line
+
+        Returns:
+            tuple: (timestamp, packet_loss, avg, jitter, sent, received,
+                    lost, min, max, duration, ping_results) or None if the
+                    line doesn't parse
+        """
+        # Fast path: positional split on the fixed delimiters. The regex
+        # only runs for lines the fast parser rejects.
+        data = cls._parse_line_fast(line, marker_idx)
+        if data is None:
+            match = cls.LOG_PATTERN_BYTES.match(line)
+            if not match:
+                return None
+            data = match.groupdict()
+        try:
+            # Manual fixed-format timestamp parse. The layout is always
+            # 'YYYY-MM-DD HH:MM:SS.ffffff', so slicing and int() avoid
+            # datetime.strptime re-interpreting the format string (and
+            # building a struct_time) per line.
+            ts = data['timestamp']
+            timestamp = datetime(
+                int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+                int(ts[20:26]))
+            return (timestamp,
+                    float(data['packet_loss']),
+                    int(data['avg']),
+                    float(data['jitter']),
+                    int(data['sent']),
+                    int(data['received']),
+                    int(data['lost']),
+                    int(data['min']),
+                    int(data['max']),
+                    float(data['duration']),
+                    cls._parse_ping_tokens(data['ping_results']))
+        except Exception as e:
+            print(f"Error parsing line: {line}\nException: {e}")
+            return None
+
     def choose_file(self):
         """
         Opens a file dialog for selecting a log file.
@@ -108,6 +330,11 @@ class LogReader:
         Returns:
             str: Selected file path or None if cancelled
         """
+        # Deferred import: the GUI toolkit is only needed when no path
+        # was passed in, and loading it delays startup on some platforms.
+        import tkinter as tk
+        from tkinter import filedialog
+
         root = tk.Tk()
         root.withdraw()
         return filedialog.askopenfilename(
@@ -115,84 +342,334 @@ class LogReader:
             filetypes=[("Log files", "*.log"), ("All files", "*.*")]
         )
     
+    @staticmethod
+    def _parse_ping_tokens(ping_results_raw):
+        """
+        Converts the raw ping-results substring (e.g. "20, timeout, 23")
+        into a list of ints, with timeouts encoded as -1 so the values can
+        be stored directly in the flat int32 ping array.
+
+        Args:
+            ping_results_raw (str or bytes): Comma-separated ping values
+                (bytes from the mmap line parser, str from the pandas path)
+
+        Returns:
+            list: Ping times in ms, with -1 for timeouts
+        """
+        if not ping_results_raw:
+            return []
+        # The monitor joins values with ', ', so splitting on that exact
+        # separator yields clean tokens directly -- no per-token
+        # strip()/lower() allocations. Each token is either an integer or
+        # the literal 'timeout'; int() is tried first since replies vastly
+        # outnumber timeouts, and it tolerates stray whitespace anyway.
+        sep = b', ' if isinstance(ping_results_raw, bytes) else ', '
+        ping_results = []
+        append = ping_results.append
+        for token in ping_results_raw.split(sep):
+            try:
+                append(int(token))
+            except ValueError:
+                append(-1)
+        return ping_results
+
+    @property
+    def detailed_logs(self):
+        """
+        Materializes the internal metric arrays back into per-record form
+        (with None for timed-out pings). Kept for compatibility with
+        external callers; internal code reads the SoA arrays directly.
+        Records are slot-based LogRecord instances rather than dicts,
+        which skips the per-record hash table entirely; they still answer
+        record['jitter']-style access.
+
+        Returns:
+            list: One LogRecord per log record
+        """
+        records = []
+        offsets = self._ping_offsets
+        for i in range(len(self.timestamps)):
+            pings = [None if v < 0 else int(v)
+                     for v in self._ping_flat[offsets[i]:offsets[i + 1]]]
+            records.append(LogRecord(
+                self.timestamps[i].item(),
+                float(self.packet_losses[i]),
+                int(self._sent[i]),
+                int(self._received[i]),
+                int(self._lost[i]),
+                int(self._min_pings[i]),
+                int(self._max_pings[i]),
+                int(self.avg_pings[i]),
+                float(self.jitters[i]),
+                float(self._durations[i]),
+                pings))
+        return records
+
+    def _store_columns(self, sent, received, lost, min_pings, max_pings,
+                       durations, ping_lists):
+        """
+        Converts per-record Python sequences into the SoA metric arrays.
+
+        Args:
+            sent, received, lost, min_pings, max_pings: Int sequences
+            durations: Float sequence
+            ping_lists (list): One list of -1-encoded ping ints per record
+        """
+        self._sent = np.asarray(sent, np.int32)
+        self._received = np.asarray(received, np.int32)
+        self._lost = np.asarray(lost, np.int32)
+        self._min_pings = np.asarray(min_pings, np.int32)
+        self._max_pings = np.asarray(max_pings, np.int32)
+        self._durations = np.asarray(durations, np.float64)
+        self._store_pings(ping_lists)
+
+    def _store_pings(self, ping_lists):
+        """
+        Flattens per-record ping lists into the CSR-style flat array plus
+        offsets layout.
+
+        Args:
+            ping_lists (list): One list of -1-encoded ping ints per record
+        """
+        lengths = [len(p) for p in ping_lists]
+        self._ping_offsets = np.zeros(len(ping_lists) + 1, np.int64)
+        np.cumsum(lengths, out=self._ping_offsets[1:])
+        self._ping_flat = np.fromiter(
+            (v for pings in ping_lists for v in pings),
+            np.int32, count=int(self._ping_offsets[-1]))
+
     def parse_log(self):
         """
         Parses the log file and stores data into instance variables.
-        
-        This method:
-        1. Reads the log file line by line
-        2. Matches each line against LOG_PATTERN
-        3. Extracts and processes numeric and timestamp values
-        4. Handles special cases like timeouts
-        5. Stores processed data in instance variables
-        
+
+        When pandas is available the whole file is parsed in one vectorized
+        pass (_parse_log_bulk); otherwise the file is processed line by line
+        (_parse_log_lines). Both paths populate the same instance variables.
+
         Raises:
             FileNotFoundError: If the log file doesn't exist
             Exception: For any parsing errors, which are logged
         """
         try:
-            with open(self.log_file_path, 'r') as logfile:
-                for line in logfile:
-                    line = line.strip()
-                    if not line:
-                        continue  # Skip empty lines
-                    
-                    match = self.LOG_PATTERN.match(line)
-                    if not match:
-                        continue  # Skip non-matching lines
-                    
-                    data = match.groupdict()
-                    try:
-                        # Parse timestamp and numeric metrics
-                        timestamp = datetime.strptime(data['timestamp'], '%Y-%m-%d %H:%M:%S.%f')
-                        packet_loss = float(data['packet_loss'])
-                        sent = int(data['sent'])
-                        received = int(data['received'])
-                        lost = int(data['lost'])
-                        min_ping = int(data['min'])
-                        max_ping = int(data['max'])
-                        avg_ping = int(data['avg'])
-                        jitter = float(data['jitter'])
-                        duration = float(data['duration'])
-                        
-                        # Process individual ping results, handling timeouts
-                        ping_results_raw = data['ping_results']
-                        ping_results = []
-                        for token in ping_results_raw.split(','):
-                            token = token.strip().lower()
-                            if token == 'timeout':
-                                ping_results.append(None)
-                            else:
-                                try:
-                                    ping_results.append(int(token))
-                                except ValueError:
-                                    ping_results.append(None)
-                        
-                        # Store parsed data in respective containers
-                        self.timestamps.append(timestamp)
-                        self.packet_losses.append(packet_loss)
-                        self.avg_pings.append(avg_ping)
-                        self.jitters.append(jitter)
-                        
-                        self.detailed_logs.append({
-                            'timestamp': timestamp,
-                            'packet_loss': packet_loss,
-                            'sent': sent,
-                            'received': received,
-                            'lost': lost,
-                            'min': min_ping,
-                            'max': max_ping,
-                            'avg': avg_ping,
-                            'jitter': jitter,
-                            'duration': duration,
-                            'ping_results': ping_results
-                        })
-                    except Exception as e:
-                        print(f"Error parsing line: {line}\nException: {e}")
+            if pd is not None:
+                self._parse_log_bulk()
+            else:
+                self._parse_log_lines()
         except FileNotFoundError:
             print("Error: The selected file was not found.")
             sys.exit(1)
-    
+
+    def _parse_log_bulk(self):
+        """
+        Vectorized parse path used when pandas is available.
+
+        Reads the file once, runs LOG_PATTERN across all lines with
+        Series.str.extract (the regex loop stays in C), and bulk-converts
+        the numeric and timestamp columns. pd.to_datetime(cache=True)
+        memoizes repeated timestamp strings instead of calling strptime
+        per line.
+        """
+        with open(self.log_file_path, 'r') as logfile:
+            lines = pd.Series(logfile.read().splitlines())
+        # Same cheap prefilter as the line-by-line path, applied in bulk.
+        lines = lines[lines.str.contains(' - Connected: ', regex=False)]
+        if lines.empty:
+            return
+
+        df = lines.str.extract(self.LOG_PATTERN).dropna()
+        if df.empty:
+            return
+
+        timestamps = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S.%f', cache=True)
+        self.timestamps = timestamps.to_numpy(dtype='datetime64[us]')
+        self._raw_lines = lines.loc[df.index].tolist()
+        self.packet_losses = df['packet_loss'].astype(float).tolist()
+        self.avg_pings = df['avg'].astype(int).tolist()
+        self.jitters = df['jitter'].astype(float).tolist()
+
+        ping_lists = [self._parse_ping_tokens(raw) for raw in df['ping_results']]
+        self._store_columns(
+            df['sent'].astype(np.int32).to_numpy(),
+            df['received'].astype(np.int32).to_numpy(),
+            df['lost'].astype(np.int32).to_numpy(),
+            df['min'].astype(np.int32).to_numpy(),
+            df['max'].astype(np.int32).to_numpy(),
+            df['duration'].astype(np.float64).to_numpy(),
+            ping_lists)
+
+    def _parse_log_lines(self):
+        """
+        Line-by-line parse path used when pandas is not installed.
+
+        The file is memory-mapped and processed as raw bytes: the log is
+        pure ASCII, so skipping the per-line UTF-8 decode avoids one str
+        allocation per line and lets the kernel page the file in on
+        demand. int()/float() consume the sliced bytes directly.
+
+        This method:
+        1. Iterates the mmap'd file line by line
+        2. Parses each line with the fast split parser (regex fallback)
+        3. Extracts and processes numeric and timestamp values
+        4. Handles special cases like timeouts
+        5. Stores processed data in instance variables
+
+        Multi-gigabyte files are split into newline-aligned byte ranges
+        and parsed by worker processes instead (every line is
+        independent, so results concatenate in chunk order).
+        """
+        file_size = os.path.getsize(self.log_file_path)
+        if file_size == 0:
+            return  # mmap cannot map an empty file
+
+        n_workers = os.cpu_count() or 1
+        if file_size >= self.PARALLEL_MIN_BYTES and n_workers > 1:
+            self._parse_log_parallel(file_size, n_workers)
+            return
+
+        with open(self.log_file_path, 'rb') as logfile, \
+                mmap.mmap(logfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # One cheap newline count (over a zero-copy view of the mmap)
+            # bounds the record count, so every column can be preallocated
+            # once and written positionally instead of growing via append
+            # (which re-sizes the backing buffer as it goes).
+            n_lines = int((np.frombuffer(mm, np.uint8) == 0x0A).sum()) + 1
+            timestamps = np.empty(n_lines, 'datetime64[us]')
+            spans = [None] * n_lines
+            packet_losses = np.empty(n_lines, np.float64)
+            avg_pings = np.empty(n_lines, np.int32)
+            jitters = np.empty(n_lines, np.float64)
+            sents = np.empty(n_lines, np.int32)
+            receiveds = np.empty(n_lines, np.int32)
+            losts = np.empty(n_lines, np.int32)
+            min_pings = np.empty(n_lines, np.int32)
+            max_pings = np.empty(n_lines, np.int32)
+            durations = np.empty(n_lines, np.float64)
+            ping_lists = []
+            idx = 0
+
+            # Specialize the hot loop for the observed format: bind the
+            # per-line callables and the prefilter literal to locals, so
+            # each iteration runs on LOAD_FAST lookups instead of
+            # attribute and global lookups.
+            parse_entry = self._parse_entry
+            marker = b' - Connected: '
+            ping_append = ping_lists.append
+
+            for line_match in self.LINE_SPLIT_PATTERN.finditer(mm):
+                line = line_match.group()
+                # Cheap substring prefilter: every parseable entry contains
+                # this literal, so skip the expensive regex for lines that
+                # cannot possibly match (blank lines, error entries, etc.).
+                marker_idx = line.find(marker)
+                if marker_idx < 0:
+                    continue
+
+                parsed = parse_entry(line, marker_idx)
+                if parsed is None:
+                    continue
+
+                # Positional writes into the preallocated columns; idx
+                # only advances once the whole record parsed cleanly.
+                (timestamps[idx], packet_losses[idx], avg_pings[idx],
+                 jitters[idx], sents[idx], receiveds[idx], losts[idx],
+                 min_pings[idx], max_pings[idx], durations[idx]) = parsed[:10]
+                spans[idx] = (line_match.start(), len(line))
+                ping_append(parsed[10])
+                idx += 1
+
+        # Trim to the records actually parsed; the array slices are views.
+        self.timestamps = timestamps[:idx]
+        self.packet_losses = packet_losses[:idx]
+        self.avg_pings = avg_pings[:idx]
+        self.jitters = jitters[:idx]
+        self._line_spans = spans[:idx]
+        self._sent = sents[:idx]
+        self._received = receiveds[:idx]
+        self._lost = losts[:idx]
+        self._min_pings = min_pings[:idx]
+        self._max_pings = max_pings[:idx]
+        self._durations = durations[:idx]
+        self._store_pings(ping_lists)
+
+    @classmethod
+    def _parse_chunk(cls, log_file_path, start, end):
+        """
+        Worker for the parallel parse path: parses every line inside the
+        [start, end) byte range of the file.
+
+        Args:
+            log_file_path (str): Path to the log file
+            start (int): Byte offset of the chunk (newline-aligned)
+            end (int): Byte offset one past the chunk
+
+        Returns:
+            tuple: Eleven per-column lists in file order (timestamps,
+                   packet losses, avg pings, jitters, sent, received,
+                   lost, min, max, durations, ping lists) plus the line
+                   spans, all picklable.
+        """
+        columns = tuple([] for _ in range(11))
+        spans = []
+        with open(log_file_path, 'rb') as logfile, \
+                mmap.mmap(logfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Same local-binding specialization as the serial hot loop.
+            parse_entry = cls._parse_entry
+            marker = b' - Connected: '
+            for line_match in cls.LINE_SPLIT_PATTERN.finditer(mm, start, end):
+                line = line_match.group()
+                marker_idx = line.find(marker)
+                if marker_idx < 0:
+                    continue
+                parsed = parse_entry(line, marker_idx)
+                if parsed is None:
+                    continue
+                for column, value in zip(columns, parsed):
+                    column.append(value)
+                spans.append((line_match.start(), len(line)))
+        return columns + (spans,)
+
+    def _parse_log_parallel(self, file_size, n_workers):
+        """
+        Parses the file with a pool of worker processes.
+
+        The file is split into roughly equal byte ranges whose boundaries
+        are advanced to the next newline, so no line straddles two
+        workers. Each worker parses its range independently and the
+        per-chunk columns are concatenated in chunk order, which preserves
+        file order.
+
+        Args:
+            file_size (int): Size of the log file in bytes
+            n_workers (int): Number of worker processes to use
+        """
+        boundaries = [0]
+        with open(self.log_file_path, 'rb') as logfile:
+            for i in range(1, n_workers):
+                logfile.seek(file_size * i // n_workers)
+                logfile.readline()  # advance to the next line start
+                boundaries.append(min(logfile.tell(), file_size))
+        boundaries.append(file_size)
+        boundaries = sorted(set(boundaries))
+        starts = boundaries[:-1]
+        ends = boundaries[1:]
+
+        worker = partial(self._parse_chunk, self.log_file_path)
+        with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+            chunks = list(pool.map(worker, starts, ends))
+
+        # Concatenate the per-chunk columns (chunk order == file order).
+        merged = [sum((chunk[i] for chunk in chunks), []) for i in range(12)]
+        (timestamps, packet_losses, avg_pings, jitters, sents, receiveds,
+         losts, min_pings, max_pings, durations, ping_lists, spans) = merged
+
+        self.timestamps = np.asarray(timestamps, 'datetime64[us]')
+        self.packet_losses = np.asarray(packet_losses, np.float64)
+        self.avg_pings = np.asarray(avg_pings, np.int32)
+        self.jitters = np.asarray(jitters, np.float64)
+        self._line_spans = spans
+        self._store_columns(sents, receiveds, losts, min_pings, max_pings,
+                            durations, ping_lists)
+
     def chunk_data(self):
         """
         Splits the dataset into segments based on time gaps.
@@ -201,37 +678,38 @@ class LogReader:
         1. Identifies gaps > 60 seconds between consecutive timestamps
         2. Creates separate segments for data before and after gaps
         3. Prevents misleading visualizations across large time gaps
-        
+
+        Gap detection is vectorized: the timestamps are viewed as
+        datetime64 microseconds and np.diff finds every gap in one C-level
+        pass, instead of allocating a timedelta per pair of datetimes in a
+        Python loop.
+
         Returns:
             list: A list of dictionaries, each containing segmented data
                   with timestamps and corresponding metrics
         """
         segments = []
-        if not self.timestamps:
+        if not len(self.timestamps):
             return segments
-        
-        start_idx = 0
-        for i in range(1, len(self.timestamps)):
-            gap = (self.timestamps[i] - self.timestamps[i - 1]).total_seconds()
-            if gap > 60:
-                seg = {
-                    'timestamps': self.timestamps[start_idx:i],
-                    'packet_losses': self.packet_losses[start_idx:i],
-                    'avg_pings': self.avg_pings[start_idx:i],
-                    'jitters': self.jitters[start_idx:i],
-                    'detailed_logs': self.detailed_logs[start_idx:i]
-                }
-                segments.append(seg)
-                start_idx = i
-        # Add the final segment
-        seg = {
-            'timestamps': self.timestamps[start_idx:],
-            'packet_losses': self.packet_losses[start_idx:],
-            'avg_pings': self.avg_pings[start_idx:],
-            'jitters': self.jitters[start_idx:],
-            'detailed_logs': self.detailed_logs[start_idx:]
-        }
-        segments.append(seg)
+
+        ts64 = np.asarray(self.timestamps, dtype='datetime64[us]')
+        ts_us = ts64.view(np.int64)
+        gaps_us = np.diff(ts_us)
+        breaks = np.where(gaps_us > 60 * 1_000_000)[0] + 1
+        boundaries = np.concatenate(([0], breaks, [len(ts64)]))
+        # Endpoint timestamps are known from the boundaries, so all
+        # segment durations come out of one vectorized subtraction.
+        self._segment_durations = (
+            ts_us[boundaries[1:] - 1] - ts_us[boundaries[:-1]]) // 1_000_000
+        segments = [
+            {
+                'timestamps': self.timestamps[a:b],
+                'packet_losses': self.packet_losses[a:b],
+                'avg_pings': self.avg_pings[a:b],
+                'jitters': self.jitters[a:b]
+            }
+            for a, b in zip(boundaries[:-1], boundaries[1:])
+        ]
         self.segments = segments
         return segments
 
@@ -248,61 +726,130 @@ class LogReader:
         """
         if min_duration_minutes <= 0:
             return self.segments
-        
-        new_segments = []
-        threshold_secs = min_duration_minutes * 60
-        for seg in self.segments:
-            ts = seg['timestamps']
-            if len(ts) < 2:
+
+        # Durations were precomputed by chunk_data, so filtering is a
+        # single vectorized comparison (single-point segments have a zero
+        # duration and fall below any positive threshold).
+        keep = self._segment_durations >= min_duration_minutes * 60
+        self.segments = [seg for seg, k in zip(self.segments, keep) if k]
+        self._segment_durations = self._segment_durations[keep]
+        return self.segments
+
+    @staticmethod
+    def _downsample(xs, ys, n_bins):
+        """
+        Selects a representative subset of points for plotting.
+
+        A screen can only show a few thousand horizontal pixels, so
+        rendering every sample of a multi-day log wastes time and memory.
+        When tsdownsample is installed its LTTB implementation is used;
+        otherwise M4 aggregation keeps the first, last, minimum and
+        maximum samples of each bin, preserving the visual envelope with
+        at most four points per pixel column.
+
+        Args:
+            xs (np.ndarray): X values (monotonic date numbers)
+            ys (np.ndarray): Y values
+            n_bins (int): Number of aggregation bins (~ pixel columns)
+
+        Returns:
+            np.ndarray: Sorted indices of the selected samples
+        """
+        if LTTBDownsampler is not None:
+            return LTTBDownsampler().downsample(xs, ys, n_out=4 * n_bins)
+
+        # M4: equal-count bins are adequate for the monitor's near-uniform
+        # sampling cadence and avoid a searchsorted over the x values.
+        n = len(ys)
+        edges = np.linspace(0, n, n_bins + 1).astype(np.int64)
+        keep = []
+        for a, b in zip(edges[:-1], edges[1:]):
+            if b <= a:
                 continue
-            duration = (ts[-1] - ts[0]).total_seconds()
-            if duration >= threshold_secs:
-                new_segments.append(seg)
-        self.segments = new_segments
-        return new_segments
+            window = ys[a:b]
+            keep.append(a)                           # first
+            keep.append(a + int(window.argmin()))    # min
+            keep.append(a + int(window.argmax()))    # max
+            keep.append(b - 1)                       # last
+        return np.unique(np.asarray(keep, np.int64))
 
     def plot_metric(self, ax, segments, metric_key, chart_type, color, label):
         """
         Plots a single metric across all segments on the provided axis.
-        
+
+        Instead of one plot/bar call per segment (which makes matplotlib
+        build a separate artist each time), all segments are concatenated
+        into a single array with NaN sentinels at the gap positions.
+        matplotlib treats NaN as a line break, so one call renders every
+        segment while still leaving the gaps visually disconnected.
+
         Args:
             ax (matplotlib.axes.Axes): The axis to plot on
             segments (list): List of segmented data
-            metric_key (str): Key for the metric to plot ('avg_pings', 'jitters', 
+            metric_key (str): Key for the metric to plot ('avg_pings', 'jitters',
                             or 'packet_losses')
             chart_type (str): '1' for line chart, '2' for bar chart
             color (str): Color to use for the plot
             label (str): Label for the legend
         """
-        first_seg = True
+        if metric_key not in ('avg_pings', 'jitters', 'packet_losses'):
+            return
+        _, mdates = _get_pyplot()
+
+        # Anything denser than ~4 points per horizontal pixel cannot be
+        # distinguished on screen, so downsample each segment beyond that.
+        n_px = max(int(ax.bbox.width), 100)
+
+        xs_parts = []
+        ys_parts = []
         for seg in segments:
             x_data = seg['timestamps']
-            # Select the correct metric data based on metric_key
-            if metric_key == 'avg_pings':
-                y_data = seg['avg_pings']
-            elif metric_key == 'jitters':
-                y_data = seg['jitters']
-            elif metric_key == 'packet_losses':
-                y_data = seg['packet_losses']
-            else:
+            if not len(x_data):
                 continue
-            
-            if not x_data:
-                continue
-            
+            x_num = mdates.date2num(x_data)
+            y_arr = np.asarray(seg[metric_key], dtype=np.float64)
+            if len(y_arr) > 4 * n_px:
+                idx = self._downsample(x_num, y_arr, n_px)
+                x_num = x_num[idx]
+                y_arr = y_arr[idx]
+            xs_parts.append(np.append(x_num, np.nan))
+            ys_parts.append(np.append(y_arr, np.nan))
+
+        if xs_parts:
+            xs = np.concatenate(xs_parts)
+            ys = np.concatenate(ys_parts)
             if chart_type == '2':  # Bar chart
-                x_num = mdates.date2num(x_data)
+                # Bars don't need the NaN line breaks; drop the sentinels.
+                valid = ~np.isnan(ys)
                 bar_width = 0.0002  # Adjust width for visibility
-                ax.bar(x_num, y_data, width=bar_width, color=color,
-                       label=label if first_seg else None)
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M:%S'))
-                ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+                ax.bar(xs[valid], ys[valid], width=bar_width, color=color, label=label)
             else:  # Line chart
-                ax.plot(x_data, y_data, '-o', color=color, linewidth=2, markersize=4,
-                        label=label if first_seg else None)
-            first_seg = False
+                ax.plot(xs, ys, '-o', color=color, linewidth=2, markersize=4,
+                        label=label)
+            # The axis receives raw date numbers, so format it as dates.
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M:%S'))
+            ax.xaxis.set_major_locator(mdates.AutoDateLocator())
         ax.grid(True)
 
+    def _show_or_save(self, fig, filename):
+        """
+        Displays the figure, or saves it next to the log file when running
+        on the non-interactive Agg backend (headless machines).
+
+        Args:
+            fig (matplotlib.figure.Figure): The figure to display or save
+            filename (str): File name to use when saving
+        """
+        import matplotlib
+        plt, _ = _get_pyplot()
+        if matplotlib.get_backend().lower() == 'agg':
+            out_path = os.path.join(os.path.dirname(self.log_file_path), filename)
+            fig.savefig(out_path)
+            plt.close(fig)
+            print(f"Plot saved at: {out_path}")
+        else:
+            plt.show()
+
     def plot_time_series(self, chart_type_ping, chart_type_jitter, chart_type_loss):
         """
         Creates a time series visualization for network performance metrics.
@@ -320,6 +867,7 @@ class LogReader:
             chart_type_jitter (str): Chart type for jitter
             chart_type_loss (str): Chart type for packet loss
         """
+        plt, _ = _get_pyplot()
         fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
         
         self.plot_metric(ax1, self.segments, 'avg_pings', chart_type_ping, 'blue', 'Average Ping (ms)')
@@ -337,9 +885,9 @@ class LogReader:
         ax3.set_title('Time Series: Packet Loss')
         ax3.set_xlabel('Timestamp')
         ax3.legend()
-        
+
         plt.tight_layout()
-        plt.show()
+        self._show_or_save(fig, 'time_series.png')
     
     def plot_histograms(self):
         """
@@ -353,26 +901,22 @@ class LogReader:
         Each histogram includes descriptive statistics and annotations
         to aid in interpretation.
         """
-        all_ping_values = []
-        all_jitter_values = []
-        all_packet_loss_values = []
-        timeout_count = 0
-        
-        # Collect values for histograms from detailed log entries
-        for record in self.detailed_logs:
-            for ping_val in record['ping_results']:
-                if ping_val is None:
-                    timeout_count += 1
-                else:
-                    all_ping_values.append(ping_val)
-            all_jitter_values.append(record['jitter'])
-            all_packet_loss_values.append(record['packet_loss'])
-        
+        # Collect values for histograms straight from the SoA arrays:
+        # timeouts are the -1 entries in the flat ping array.
+        valid_mask = self._ping_flat >= 0
+        timeout_count = int((~valid_mask).sum())
+        all_ping_values = self._ping_flat[valid_mask]
+        all_jitter_values = np.asarray(self.jitters)
+        all_packet_loss_values = np.asarray(self.packet_losses)
+
+        plt, _ = _get_pyplot()
         fig, axs = plt.subplots(3, 1, figsize=(10, 12))
-        
+
         # Ping Histogram with timeout count
-        if all_ping_values:
-            bins_ping = range(min(all_ping_values), max(all_ping_values) + 2)
+        if all_ping_values.size:
+            # One integer-wide bin per millisecond, as a ready-made array
+            # so hist() doesn't have to materialize the range itself.
+            bins_ping = np.arange(all_ping_values.min(), all_ping_values.max() + 2)
             axs[0].hist(all_ping_values, bins=bins_ping, color='blue', alpha=0.7, edgecolor='black')
             axs[0].set_xlabel('Ping Time (ms)')
             axs[0].set_ylabel('Frequency')
@@ -385,7 +929,7 @@ class LogReader:
             axs[0].text(0.5, 0.5, "No numeric ping results to display.", ha='center', va='center')
         
         # Jitter Histogram
-        if all_jitter_values:
+        if all_jitter_values.size:
             axs[1].hist(all_jitter_values, bins=10, color='green', alpha=0.7, edgecolor='black')
             axs[1].set_xlabel('Jitter (ms)')
             axs[1].set_ylabel('Frequency')
@@ -398,8 +942,8 @@ class LogReader:
             axs[1].text(0.5, 0.5, "No jitter data to display.", ha='center', va='center')
         
         # Packet Loss Histogram
-        if all_packet_loss_values:
-            unique_losses = sorted(set(all_packet_loss_values))
+        if all_packet_loss_values.size:
+            unique_losses = np.unique(all_packet_loss_values)
             axs[2].hist(all_packet_loss_values, bins=unique_losses, color='red', alpha=0.7, edgecolor='black')
             axs[2].set_xlabel('Packet Loss (%)')
             axs[2].set_ylabel('Frequency')
@@ -410,9 +954,9 @@ class LogReader:
                         bbox=dict(boxstyle="round", fc="w"))
         else:
             axs[2].text(0.5, 0.5, "No packet loss data to display.", ha='center', va='center')
-        
+
         plt.tight_layout()
-        plt.show()
+        self._show_or_save(fig, 'histograms.png')
     
     def generate_sample(self):
         """
@@ -423,24 +967,35 @@ class LogReader:
         2. Extracts all log entries within that period
         3. Formats them into a markdown document
         4. Saves the sample to a file
-        
+
+        The lines were already captured during parse_log, and timestamps
+        are monotonically non-decreasing, so the cutoff is found with a
+        single searchsorted instead of re-reading and re-matching the file.
+
         Returns:
             str: The generated sample text in markdown format
         """
         sample_lines = []
-        if self.timestamps:
-            sample_start = min(self.timestamps)
-            sample_end = sample_start + timedelta(minutes=30)
-            with open(self.log_file_path, 'r') as logfile:
-                for line in logfile:
-                    line_strip = line.strip()
-                    if not line_strip:
-                        continue
-                    m = self.LOG_PATTERN.match(line_strip)
-                    if m:
-                        ts = datetime.strptime(m.group("timestamp"), '%Y-%m-%d %H:%M:%S.%f')
-                        if ts <= sample_end:
-                            sample_lines.append(line_strip)
+        if len(self.timestamps):
+            sample_end = self.timestamps[0] + np.timedelta64(30, 'm')
+            cut = int(np.searchsorted(self.timestamps, sample_end, side='right'))
+            if self._line_spans:
+                # The mmap parser stored byte spans rather than copies of
+                # the lines; read the sampled byte range back in one go
+                # and slice the individual entries out of it.
+                spans = self._line_spans[:cut]
+                if spans:
+                    start = spans[0][0]
+                    end = spans[-1][0] + spans[-1][1]
+                    with open(self.log_file_path, 'rb') as logfile:
+                        logfile.seek(start)
+                        buf = logfile.read(end - start)
+                    sample_lines = [
+                        buf[offset - start:offset - start + length].decode('ascii', 'replace')
+                        for offset, length in spans
+                    ]
+            else:
+                sample_lines = self._raw_lines[:cut]
         
         sample_text = "### 30-Minute Data Sample (Exact Excerpt from Log File)\n\n"
         if sample_lines:
@@ -468,12 +1023,12 @@ class LogReader:
         Returns:
             str: The generated prompt text in markdown format
         """
-        total_entries = len(self.detailed_logs)
+        total_entries = len(self.timestamps)
         num_segments = len(self.segments)
-        avg_ping_value = sum(self.avg_pings) / len(self.avg_pings) if self.avg_pings else 0
-        avg_jitter_value = sum(self.jitters) / len(self.jitters) if self.jitters else 0
-        avg_packet_loss_value = sum(self.packet_losses) / len(self.packet_losses) if self.packet_losses else 0
-        timeout_count_prompt = sum(1 for record in self.detailed_logs for ping in record['ping_results'] if ping is None)
+        avg_ping_value = float(np.mean(self.avg_pings)) if len(self.avg_pings) else 0
+        avg_jitter_value = float(np.mean(self.jitters)) if len(self.jitters) else 0
+        avg_packet_loss_value = float(np.mean(self.packet_losses)) if len(self.packet_losses) else 0
+        timeout_count_prompt = int((self._ping_flat < 0).sum())
         
         prompt_text = f"""# IDENTITY and PURPOSE
         You are a network performance analyst responsible for evaluating the quality and reliability of network connections using detailed log data. Your expertise allows you to interpret key metrics such as ping, jitter, and packet loss, and provide actionable insights.
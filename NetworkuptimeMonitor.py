@@ -43,8 +43,13 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import os
 import time
+import socket
 import subprocess
 import re
+import ctypes
+import ipaddress
+import queue
+import threading
 import traceback
 from datetime import datetime
 import configparser
@@ -55,21 +60,216 @@ from typing import List, Optional
 # Configuration file path
 CONFIG_FILE = 'ping_config.ini'
 
+# icmplib is optional: when available, ping tests run over its raw-socket
+# API instead of spawning the system ping binary for every test, which
+# removes the fork/exec and output-parsing overhead from each cycle.
+try:
+    import icmplib
+except ImportError:
+    icmplib = None
+
+# numpy is optional too: when available, jitter and RTT statistics are
+# computed in a single vectorized pass instead of per-element Python loops.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Set when icmplib turns out to be unusable at runtime (e.g. unprivileged
+# datagram ICMP sockets are not permitted on this system); the subprocess
+# path is used from then on.
+_icmplib_failed = False
+
+# Set once a multi-target config has been warned about falling back to
+# single-target monitoring, so the error log is not flooded per cycle.
+_multi_target_warned = False
+
+
+class _IpOptionInformation(ctypes.Structure):
+    """IP_OPTION_INFORMATION from the Windows IP Helper API."""
+    _fields_ = [
+        ("Ttl", ctypes.c_ubyte),
+        ("Tos", ctypes.c_ubyte),
+        ("Flags", ctypes.c_ubyte),
+        ("OptionsSize", ctypes.c_ubyte),
+        ("OptionsData", ctypes.c_void_p),
+    ]
+
+
+class _IcmpEchoReply(ctypes.Structure):
+    """ICMP_ECHO_REPLY from the Windows IP Helper API."""
+    _fields_ = [
+        ("Address", ctypes.c_uint32),
+        ("Status", ctypes.c_uint32),
+        ("RoundTripTime", ctypes.c_uint32),
+        ("DataSize", ctypes.c_ushort),
+        ("Reserved", ctypes.c_ushort),
+        ("Data", ctypes.c_void_p),
+        ("Options", _IpOptionInformation),
+    ]
+
+
+class _WindowsIcmp:
+    """
+    Thin ctypes wrapper around the Windows IP Helper ICMP API.
+
+    IcmpCreateFile() is called once at construction and the handle reused
+    for every echo, so a test cycle no longer pays CreateProcess plus
+    console I/O for ping.exe. Each echo goes through IcmpSendEcho2 with a
+    reusable event and the reply's Status/RoundTripTime fields are read
+    straight from the ICMP_ECHO_REPLY struct -- no output text to parse.
+
+    Attributes:
+        ERROR_IO_PENDING (int): Win32 code signalling an async echo in flight
+        IP_SUCCESS (int): IP_STATUS code for a successful echo reply
+    """
+    ERROR_IO_PENDING = 997
+    IP_SUCCESS = 0
+
+    def __init__(self):
+        # use_last_error makes ctypes capture GetLastError() per call so
+        # ctypes.get_last_error() below reports the real failure code.
+        self._iphlpapi = ctypes.WinDLL('iphlpapi', use_last_error=True)
+        self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self._handle = self._iphlpapi.IcmpCreateFile()
+        if self._handle == -1:  # INVALID_HANDLE_VALUE
+            raise OSError("IcmpCreateFile failed")
+        # Auto-reset event, reused for every echo.
+        self._event = self._kernel32.CreateEventW(None, False, False, None)
+        if not self._event:
+            raise OSError("CreateEventW failed")
+        self._send_data = b'NetworkUptimeMonitor-ping-data--'  # 32 bytes
+        self._reply_size = ctypes.sizeof(_IcmpEchoReply) + len(self._send_data) + 8
+        self._reply_buf = ctypes.create_string_buffer(self._reply_size)
+
+    def ping_once(self, target: str, timeout_ms: int) -> Optional[int]:
+        """
+        Sends a single echo request and waits for the reply.
+
+        Args:
+            target (str): IPv4 address to ping
+            timeout_ms (int): Reply timeout in milliseconds
+
+        Returns:
+            Optional[int]: Round-trip time in ms, or None on timeout
+
+        Raises:
+            OSError: If the echo could not be sent at all, so ping_test
+                can demote this path instead of reporting it as packet loss
+        """
+        dest = ctypes.c_uint32.from_buffer_copy(socket.inet_aton(target))
+        rc = self._iphlpapi.IcmpSendEcho2(
+            self._handle, self._event, None, None,
+            dest, self._send_data, len(self._send_data), None,
+            self._reply_buf, self._reply_size, timeout_ms
+        )
+        if rc == 0:
+            err = ctypes.get_last_error()
+            if err not in (0, self.ERROR_IO_PENDING):
+                raise OSError(f"IcmpSendEcho2 failed (error {err})")
+        # Allow a little slack beyond the ICMP timeout for the event wait.
+        if self._kernel32.WaitForSingleObject(self._event, timeout_ms + 500) != 0:
+            return None
+        if self._iphlpapi.IcmpParseReplies(self._reply_buf, self._reply_size) < 1:
+            return None
+        reply = ctypes.cast(self._reply_buf, ctypes.POINTER(_IcmpEchoReply)).contents
+        if reply.Status != self.IP_SUCCESS:
+            return None
+        return int(reply.RoundTripTime)
+
+    def close(self):
+        """Releases the ICMP handle and the reply event."""
+        if self._handle not in (None, -1):
+            self._iphlpapi.IcmpCloseHandle(self._handle)
+            self._handle = None
+        if self._event:
+            self._kernel32.CloseHandle(self._event)
+            self._event = None
+
+
+# Lazily constructed _WindowsIcmp singleton; stays None off Windows or
+# after the API fails, in which case the subprocess path takes over.
+_win_icmp = None
+_win_icmp_failed = False
+
 # Pre-compile regex patterns for performance optimization
 # These patterns match the output format of ping commands across different platforms
-# Match ping replies like "time=9ms", "time<1ms", or "time=0.37 ms".
-# Some ping implementations include fractional milliseconds and a space
-# before the "ms" unit, so we capture optional decimals and whitespace.
-REPLY_TIME_PATTERN = re.compile(r"time[=<]\s*(\d+(?:\.\d+)?)\s*ms")
+# Match ping replies like "time=9ms", "time<1ms", or "time=0.37 ms".
+# Some ping implementations include fractional milliseconds and a space
+# before the "ms" unit, so we capture optional decimals and whitespace.
+REPLY_TIME_PATTERN = re.compile(r"time[=<]\s*(\d+(?:\.\d+)?)\s*ms")
 PACKET_COUNT_PATTERN = re.compile(r"Sent = (\d+), Received = (\d+), Lost = (\d+)")
 RTT_STATS_PATTERN = re.compile(r"Minimum = (\d+)ms, Maximum = (\d+)ms, Average = (\d+)ms")
+# Fused sweep for one-shot ping output: a single finditer pass over the whole
+# buffer picks up both reply times and timeout lines, instead of splitting into
+# lines and running two substring scans plus a regex per line.
+REPLY_OR_TIMEOUT_PATTERN = re.compile(r"time[=<]\s*(\d+(?:\.\d+)?)\s*ms|Request timed out")
+
+# Bytes twins of the patterns above: ping output is pure ASCII, so the
+# one-shot path scans the raw stdout buffer without a decode pass.
+PACKET_COUNT_PATTERN_BYTES = re.compile(PACKET_COUNT_PATTERN.pattern.encode('ascii'))
+RTT_STATS_PATTERN_BYTES = re.compile(RTT_STATS_PATTERN.pattern.encode('ascii'))
+REPLY_OR_TIMEOUT_PATTERN_BYTES = re.compile(REPLY_OR_TIMEOUT_PATTERN.pattern.encode('ascii'))
+
+# Maximum number of queued entries the background writer drains per wakeup.
+LOG_BATCH_SIZE = 32
 
-@dataclass
+# Shared LogManager for the error log, opened by main() so error events
+# reuse one descriptor instead of re-opening the file per event. Stays
+# None (with a one-off open() fallback) outside a monitoring run.
+_error_log = None
+
+def _log_error(message: str):
+    """
+    Writes a timestamped message to the error log.
+
+    Args:
+        message (str): The error description (may span multiple lines)
+    """
+    entry = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {message}\n"
+    if _error_log is not None:
+        # Errors are rare, so write through immediately.
+        _error_log.write(entry.encode("ascii", errors="replace"))
+        _error_log.flush_pending()
+    else:
+        with open(ERROR_LOG, "a") as err_log:
+            err_log.write(entry)
+
+# Per-second cache for the log timestamp prefix: the date-and-seconds part
+# only changes once per second, so strftime runs about once a second
+# instead of once per entry at sub-second polling rates.
+_last_ts_sec = -1
+_last_ts_prefix = ""
+
+def _log_timestamp() -> str:
+    """Returns the current wall-clock timestamp for a log entry."""
+    global _last_ts_sec, _last_ts_prefix
+    now = time.time()
+    sec = int(now)
+    if sec != _last_ts_sec:
+        _last_ts_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_ts_sec = sec
+    return f"{_last_ts_prefix}.{int((now - sec) * 1e6):06d}"
+
+def _fmt_ping(x) -> str:
+    """
+    Formats a single ping result for the log entry ("timeout" for None).
+
+    RTTs are logged as whole milliseconds regardless of which ping path
+    collected them: the icmplib, streaming and Unix subprocess paths all
+    hold floats, but LogReader parses each list token with int() and
+    treats anything unparsable as a timeout.
+    """
+    return "timeout" if x is None else str(round(x))
+
+@dataclass(slots=True, frozen=True)
 class PingResult:
     """
     Data class that encapsulates all results from a ping test.
     This provides a more structured and type-safe way to handle test results
-    compared to using tuples.
+    compared to using tuples. Results are immutable once constructed, and
+    slots keep attribute access a fixed-offset load with no per-instance
+    __dict__.
 
     Attributes:
         connected (bool): True if at least one ping reply was received
@@ -84,6 +284,8 @@ class PingResult:
         test_duration (float): Total duration of the test in seconds
         ping_results (List[Optional[int]]): Individual ping times (None for timeouts)
         error (str): Any error messages encountered during the test
+        target (str): The address this result is for; empty in single-target
+            runs, where the log entry needs no target annotation
     """
     connected: bool
     loss_percent: float
@@ -97,6 +299,7 @@ class PingResult:
     test_duration: float
     ping_results: List[Optional[int]]
     error: str
+    target: str = ""
 
 class LogManager:
     """
@@ -110,55 +313,80 @@ class LogManager:
     Attributes:
         MAX_LOG_SIZE (int): Maximum size of log file before rotation (10MB)
         filename (str): Path to the log file
-        file: File handle for the current log file
+        fd (int): Raw file descriptor for the current log file
     """
     MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
 
     def __init__(self, filename):
         """
         Initialize the log manager with a specific log file.
-        
+
         Args:
             filename (str): Path to the log file
         """
         self.filename = filename
-        self.file = None
+        self.fd = None
+        self.pending: List[bytes] = []
         self._open_log()
 
     def _open_log(self):
         """Opens or reopens the log file for appending."""
-        if self.file:
-            self.file.close()
-        self.file = open(self.filename, "a")
+        if self.fd is not None:
+            os.close(self.fd)
+        self.fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # Sole-writer assumption: track the size in-process so rotation
+        # checks never need a stat syscall.
+        self.bytes_written = os.fstat(self.fd).st_size
 
     def _check_rotation(self):
         """
         Checks if log rotation is needed and performs rotation if necessary.
-        Rotation occurs when the file size exceeds MAX_LOG_SIZE.
+        Rotation occurs when the tracked file size exceeds MAX_LOG_SIZE.
         """
-        if os.path.getsize(self.filename) > self.MAX_LOG_SIZE:
-            self.file.close()
+        if self.bytes_written > self.MAX_LOG_SIZE:
+            os.close(self.fd)
+            self.fd = None
             backup = f"{self.filename}.1"
             if os.path.exists(backup):
                 os.remove(backup)
             os.rename(self.filename, backup)
             self._open_log()
 
-    def write(self, entry):
+    def write(self, entry: bytes):
         """
-        Writes an entry to the log file, handling rotation if needed.
-        
+        Queues a pre-encoded entry for the log file.
+
+        Entries only accumulate in the pending list; flush_pending()
+        writes the whole batch to the descriptor in one syscall, so
+        consecutive entries share a single write instead of one each.
+
         Args:
-            entry (str): The log entry to write
+            entry (bytes): The log entry to write, already ASCII-encoded
+        """
+        self.pending.append(entry)
+
+    def flush_pending(self):
+        """
+        Writes all pending entries in a single os.write on the raw fd.
+
+        Writing bytes straight to the descriptor skips the text-layer
+        locking, encoding and buffer bookkeeping that a file object adds
+        per call, and needs no separate flush.
         """
+        if not self.pending:
+            return
         self._check_rotation()
-        self.file.write(entry)
-        self.file.flush()
+        buf = b"".join(self.pending)
+        os.write(self.fd, buf)
+        self.bytes_written += len(buf)
+        self.pending.clear()
 
     def close(self):
-        """Closes the log file handle properly."""
-        if self.file:
-            self.file.close()
+        """Writes any pending entries and closes the descriptor."""
+        if self.fd is not None:
+            self.flush_pending()
+            os.close(self.fd)
+            self.fd = None
 
 def validate_config(config):
     """
@@ -178,10 +406,16 @@ def validate_config(config):
         SystemExit: If validation fails
     """
     try:
-        # Basic IP address format validation
-        if not re.match(r'^(\d{1,3}\.){3}\d{1,3}$', config['target']):
-            raise ValueError("Invalid IP address format")
-        
+        # ipaddress is C-backed and validates properly (the old regex
+        # accepted octets like 999); it also admits IPv6 targets. The
+        # target may be a comma-separated list of addresses.
+        for target in config['target'].split(','):
+            try:
+                ipaddress.ip_address(target.strip())
+            except ValueError:
+                raise ValueError("Invalid IP address format")
+
+
         count = int(config['count'])
         if not (1 <= count <= 100):
             raise ValueError("Count must be between 1 and 100")
@@ -206,7 +440,8 @@ def load_config():
     Validates all configuration values before returning.
     
     Default settings:
-      - target: The IP address to ping (default: 8.8.8.8)
+      - target: The IP address to ping, or a comma-separated list of
+        addresses for multi-target monitoring (default: 8.8.8.8)
       - count: Number of ping packets to send (default: 10)
       - timeout: Ping timeout in milliseconds (default: 1000)
       - desired_interval: Time in seconds between ping tests (default: 0.1)
@@ -236,26 +471,146 @@ def load_config():
     validate_config(config['DEFAULT'])
     return config['DEFAULT']
 
+def _ping_ip_flags(target: str) -> List[str]:
+    """
+    Returns the address-family flags for the ping command.
+
+    IPv6 targets need an explicit -6 on both Windows ping and iputils;
+    hostnames and IPv4 addresses need nothing.
+
+    Args:
+        target (str): IP address or hostname to ping
+
+    Returns:
+        List[str]: Extra flags to splice into the ping command
+    """
+    try:
+        if ipaddress.ip_address(target).version == 6:
+            return ["-6"]
+    except ValueError:
+        pass  # hostname; let ping resolve it
+    return []
+
 def get_ping_command(target: str, count: int, timeout: str) -> List[str]:
     """
     Constructs the appropriate ping command for the current operating system.
-    
+
     Args:
         target (str): IP address or hostname to ping
         count (int): Number of ping packets to send
         timeout (str): Timeout value in milliseconds
-    
+
     Returns:
         List[str]: Command list ready for subprocess.run()
     """
     if os.name == 'nt':  # Windows
-        return ["ping", "-n", str(count), "-w", timeout, target]
+        return ["ping", *_ping_ip_flags(target), "-n", str(count), "-w", timeout, target]
+    else:  # Unix-like systems
+        return ["ping", *_ping_ip_flags(target), "-c", str(count), "-W", str(int(timeout)/1000), target]
+
+def get_ping_stream_command(target: str, timeout: str) -> List[str]:
+    """
+    Constructs a continuous-mode ping command for the current operating system.
+
+    Windows uses ``-t``; Unix ping runs continuously by default, and ``-O``
+    makes iputils print a line for unanswered packets so the streaming
+    parser sees one line per echo either way.
+
+    Args:
+        target (str): IP address or hostname to ping
+        timeout (str): Timeout value in milliseconds
+
+    Returns:
+        List[str]: Command list ready for subprocess.Popen()
+    """
+    if os.name == 'nt':  # Windows
+        return ["ping", *_ping_ip_flags(target), "-t", "-w", timeout, target]
     else:  # Unix-like systems
-        return ["ping", "-c", str(count), "-W", str(int(timeout)/1000), target]
+        return ["ping", *_ping_ip_flags(target), "-O", "-W", str(int(timeout)/1000), target]
 
-# Load configuration and assign global variables.
+class PingStream:
+    """
+    Persistent continuous-mode ping subprocess shared across test cycles.
+
+    Spawning ping once with continuous mode and reading its stdout
+    line-by-line amortizes the fork/exec cost over the whole monitoring
+    session instead of paying it on every test. Each call to
+    read_window() consumes COUNT reply lines and the summary statistics
+    are computed in Python, since continuous ping never prints one.
+
+    Attributes:
+        proc: The underlying subprocess.Popen handle (spawned lazily)
+    """
+
+    def __init__(self):
+        self.proc = None
+
+    def _spawn(self):
+        """Starts the continuous ping subprocess."""
+        self.proc = subprocess.Popen(
+            PING_STREAM_CMD,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=PING_ENV
+        )
+
+    def read_window(self, count: int) -> List[Optional[float]]:
+        """
+        Reads the next window of ping replies from the stream.
+
+        Args:
+            count (int): Number of echo results to collect
+
+        Returns:
+            List[Optional[float]]: Ping times in ms (None for timeouts)
+
+        Raises:
+            OSError: If the ping subprocess has exited or closed stdout
+        """
+        if self.proc is None or self.proc.poll() is not None:
+            self._spawn()
+        # Preallocated at the window size: timeouts stay None, replies are
+        # index-assigned, so the list never reallocates as it grows.
+        ping_results: List[Optional[float]] = [None] * count
+        idx = 0
+        while idx < count:
+            line = self.proc.stdout.readline()
+            if not line:
+                raise OSError("ping stream ended unexpectedly")
+            match_time = REPLY_TIME_PATTERN.search(line)
+            if match_time:
+                ping_results[idx] = float(match_time.group(1))
+                idx += 1
+            elif ("Request timed out" in line or "no answer yet" in line
+                    or "unreachable" in line):
+                idx += 1
+            # Header/summary/blank lines carry no echo result; skip them.
+        return ping_results
+
+    def close(self):
+        """Terminates the ping subprocess if it is running."""
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+        self.proc = None
+
+# Lazily constructed PingStream singleton; stays None until the stream
+# path is first used, or permanently after it fails.
+_ping_stream = None
+_ping_stream_failed = False
+
+# Load configuration and assign global variables. The target option may
+# hold several comma-separated addresses; the subprocess and Windows ICMP
+# fallbacks only monitor the first, multi-target runs need icmplib.
 config = load_config()
-TARGET = config.get('target', '8.8.8.8')
+TARGETS = [t.strip() for t in config.get('target', '8.8.8.8').split(',')]
+TARGET = TARGETS[0]
 COUNT = config.getint('count', 10)
 TIMEOUT = config.get('timeout', '1000')  # as string for subprocess
 DESIRED_INTERVAL = config.getfloat('desired_interval', 0.1)
@@ -263,6 +618,13 @@ ALL_ATTEMPTS_LOG = config.get('all_attempts_log', 'all_attempts.log')
 LOST_CONNECTION_LOG = config.get('lost_connection_log', 'lost_connection.log')
 ERROR_LOG = config.get('error_log', 'error.log')
 
+# The ping argv and environment never change after config load, so build
+# them once instead of per test. LC_ALL=C locks ping output to English so
+# the reply patterns match on localized systems.
+PING_CMD = get_ping_command(TARGET, COUNT, TIMEOUT)
+PING_STREAM_CMD = get_ping_stream_command(TARGET, TIMEOUT)
+PING_ENV = {**os.environ, "LC_ALL": "C"}
+
 def get_test_duration():
     """
     Prompts the user to select a test duration preference.
@@ -303,8 +665,262 @@ def get_test_duration():
 
 def ping_test() -> PingResult:
     """
-    Performs a complete ping test using platform-specific commands.
-    
+    Performs a complete ping test.
+
+    Uses icmplib's raw-socket API when it is installed and usable (no
+    process spawn, no output parsing); on Windows without icmplib it
+    falls back to the native IcmpSendEcho2 API, then to a persistent
+    continuous-mode ping subprocess, and only as a last resort runs a
+    fresh ping process per test via subprocess.run. When a faster
+    path fails at runtime -- e.g. unprivileged datagram ICMP sockets are
+    not permitted -- the failure is logged once and all further tests
+    use the next path down.
+
+    Returns:
+        PingResult: Complete results of the ping test
+    """
+    global _icmplib_failed, _win_icmp, _win_icmp_failed, _ping_stream, _ping_stream_failed
+    if icmplib is not None and not _icmplib_failed:
+        try:
+            return _ping_test_icmplib()
+        except (icmplib.ICMPLibError, OSError) as e:
+            _icmplib_failed = True
+            _log_error(f"icmplib unavailable ({e}); falling back to subprocess ping")
+    if os.name == 'nt' and not _win_icmp_failed:
+        try:
+            if _win_icmp is None:
+                _win_icmp = _WindowsIcmp()
+            return _ping_test_windows()
+        except OSError as e:
+            _win_icmp_failed = True
+            _log_error(f"IcmpSendEcho2 unavailable ({e}); falling back to subprocess ping")
+    if not _ping_stream_failed:
+        try:
+            if _ping_stream is None:
+                _ping_stream = PingStream()
+            return _ping_test_stream()
+        except OSError as e:
+            _ping_stream_failed = True
+            _ping_stream.close()
+            _log_error(f"ping stream unavailable ({e}); falling back to one-shot ping")
+    return _ping_test_subprocess()
+
+
+def _ping_stats(valid_times: List[float]):
+    """
+    Computes jitter and RTT statistics from the received ping times.
+
+    Uses NumPy for the whole computation when it is available and the
+    sample is large enough to amortize array creation; below that
+    threshold (or without numpy) plain Python is faster.
+
+    Args:
+        valid_times (List[float]): Ping times in ms, timeouts excluded
+
+    Returns:
+        Tuple of (jitter, min_time, max_time, avg_time); the RTT fields
+        are None when no replies were received
+    """
+    n = len(valid_times)
+    if not n:
+        return 0.0, None, None, None
+    if np is not None and n >= 8:
+        arr = np.asarray(valid_times, dtype=np.float64)
+        jitter = float(np.abs(np.diff(arr)).mean())
+        return jitter, int(arr.min()), int(arr.max()), int(arr.mean())
+    if n > 1:
+        jitter = sum(abs(valid_times[i+1] - valid_times[i]) for i in range(n - 1)) / (n - 1)
+    else:
+        jitter = 0
+    return jitter, int(min(valid_times)), int(max(valid_times)), int(sum(valid_times) / n)
+
+
+def _result_from_pings(ping_results: List[Optional[float]],
+                       test_duration: float, error: str = "") -> PingResult:
+    """
+    Builds a PingResult from a list of individual ping times.
+
+    Used by the paths that collect echoes one at a time (IcmpSendEcho2,
+    streaming ping) and therefore have no summary text to parse; packet
+    counts, RTT statistics and jitter are all derived from the list.
+
+    Args:
+        ping_results (List[Optional[float]]): Ping times in ms (None for timeouts)
+        test_duration (float): Total duration of the test in seconds
+        error (str): Any error message to attach to the result
+
+    Returns:
+        PingResult: Complete results of the ping test
+    """
+    valid_times = [pt for pt in ping_results if pt is not None]
+    jitter, min_time, max_time, avg_time = _ping_stats(valid_times)
+
+    sent = len(ping_results)
+    received = len(valid_times)
+    lost = sent - received
+    loss_percent = (lost / sent) * 100 if sent else 100.0
+
+    return PingResult(
+        connected=received > 0,
+        loss_percent=loss_percent,
+        sent=sent,
+        received=received,
+        lost=lost,
+        min_time=min_time,
+        max_time=max_time,
+        avg_time=avg_time,
+        jitter=jitter,
+        test_duration=test_duration,
+        ping_results=ping_results,
+        error=error
+    )
+
+
+def _ping_test_stream() -> PingResult:
+    """
+    Performs a ping test by reading one window from the persistent stream.
+
+    Returns:
+        PingResult: Complete results of the ping test
+    """
+    start_time = time.monotonic()
+    ping_results = _ping_stream.read_window(COUNT)
+    return _result_from_pings(ping_results, time.monotonic() - start_time)
+
+
+def ping_test_all() -> List[PingResult]:
+    """
+    Performs one monitoring cycle across every configured target.
+
+    With several targets and icmplib available, a single multiping call
+    interleaves the echoes for all hosts over one socket, so adding
+    targets does not multiply the cycle time. Without icmplib the
+    fallback paths only support one address, so monitoring degrades to
+    the primary target; the degradation is logged once either here
+    (icmplib missing) or when the multiping call fails.
+
+    Returns:
+        List[PingResult]: One result per monitored target
+    """
+    global _icmplib_failed, _multi_target_warned
+    if len(TARGETS) > 1:
+        if icmplib is not None and not _icmplib_failed:
+            try:
+                start_time = time.monotonic()
+                hosts = icmplib.multiping(
+                    TARGETS,
+                    count=COUNT,
+                    interval=DESIRED_INTERVAL,
+                    timeout=int(TIMEOUT) / 1000,
+                    privileged=False
+                )
+                test_duration = time.monotonic() - start_time
+                return [_result_from_host(host, test_duration, host.address)
+                        for host in hosts]
+            except (icmplib.ICMPLibError, OSError) as e:
+                _icmplib_failed = True
+                _multi_target_warned = True
+                _log_error(f"icmplib multiping unavailable ({e}); monitoring primary target only")
+        elif not _multi_target_warned:
+            _multi_target_warned = True
+            _log_error(
+                f"{len(TARGETS)} targets configured but icmplib is not available; "
+                f"monitoring primary target {TARGET} only")
+    return [ping_test()]
+
+
+def _ping_test_icmplib() -> PingResult:
+    """
+    Performs a ping test through icmplib's socket API.
+
+    The returned Host object carries packet counts, RTT statistics and
+    jitter directly, so none of the ping-output regexes are needed on
+    this path. Unprivileged datagram sockets are requested, which work
+    without root on most modern systems.
+
+    Returns:
+        PingResult: Complete results of the ping test
+    """
+    start_time = time.monotonic()
+    host = icmplib.ping(
+        TARGET,
+        count=COUNT,
+        interval=DESIRED_INTERVAL,
+        timeout=int(TIMEOUT) / 1000,
+        privileged=False
+    )
+    return _result_from_host(host, time.monotonic() - start_time)
+
+
+def _result_from_host(host, test_duration: float, target: str = "") -> PingResult:
+    """
+    Maps an icmplib Host object onto a PingResult.
+
+    Args:
+        host: icmplib Host carrying packet counts, RTTs and jitter
+        test_duration (float): Total duration of the test in seconds
+        target (str): Address annotation for multi-target log entries
+
+    Returns:
+        PingResult: Complete results of the ping test
+    """
+    sent = host.packets_sent
+    received = host.packets_received
+    lost = sent - received
+    loss_percent = (lost / sent) * 100 if sent else 100.0
+    # icmplib only reports the RTTs of received replies; represent each
+    # lost packet as a trailing timeout entry.
+    ping_results = list(host.rtts) + [None] * lost
+    if received:
+        min_time = int(host.min_rtt)
+        max_time = int(host.max_rtt)
+        avg_time = int(host.avg_rtt)
+    else:
+        min_time = max_time = avg_time = None
+
+    return PingResult(
+        connected=received > 0,
+        loss_percent=loss_percent,
+        sent=sent,
+        received=received,
+        lost=lost,
+        min_time=min_time,
+        max_time=max_time,
+        avg_time=avg_time,
+        jitter=host.jitter,
+        test_duration=test_duration,
+        ping_results=ping_results,
+        error="",
+        target=target
+    )
+
+
+def _ping_test_windows() -> PingResult:
+    """
+    Performs a ping test through the Windows IcmpSendEcho2 API.
+
+    Sends COUNT echo requests over the module-level _WindowsIcmp handle,
+    pacing them DESIRED_INTERVAL apart like ping.exe would, and derives
+    the summary statistics in Python since there is no summary text to
+    parse on this path.
+
+    Returns:
+        PingResult: Complete results of the ping test
+    """
+    start_time = time.monotonic()
+    timeout_ms = int(TIMEOUT)
+    ping_results: List[Optional[float]] = [None] * COUNT
+    for i in range(COUNT):
+        if i:
+            time.sleep(DESIRED_INTERVAL)
+        ping_results[i] = _win_icmp.ping_once(TARGET, timeout_ms)
+    return _result_from_pings(ping_results, time.monotonic() - start_time)
+
+
+def _ping_test_subprocess() -> PingResult:
+    """
+    Performs a ping test by running the system ping binary.
+
     This function:
     1. Executes the ping command appropriate for the OS
     2. Captures and parses the command output
@@ -314,47 +930,59 @@ def ping_test() -> PingResult:
        - Round-trip time statistics
        - Jitter (variation in ping times)
     4. Handles and logs any errors encountered
-    
+
     Returns:
         PingResult: Complete results of the ping test
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     try:
-        # Build the ping command using configured parameters.
-        cmd = get_ping_command(TARGET, COUNT, TIMEOUT)
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
+        # Stream stdout instead of waiting for the process to exit, so
+        # connectivity is known as soon as the first reply (or timeout)
+        # arrives rather than after COUNT pings plus the summary. The
+        # output stays bytes and is scanned with the bytes patterns,
+        # skipping a decode pass; group(1) is empty for timeout matches.
+        proc = subprocess.Popen(
+            PING_CMD,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=PING_ENV
         )
-        end_time = time.time()
+        # Preallocated at the expected size; index-assignment avoids list
+        # growth and the tail is trimmed if ping sent fewer than COUNT.
+        ping_results = [None] * COUNT
+        idx = 0
+        connected = False
+        summary_lines = []
+        for line in proc.stdout:
+            match_line = REPLY_OR_TIMEOUT_PATTERN_BYTES.search(line)
+            if match_line:
+                if idx >= len(ping_results):
+                    ping_results.append(None)
+                if match_line.group(1):
+                    ping_results[idx] = float(match_line.group(1))
+                    connected = True
+                idx += 1
+            else:
+                # Header and summary lines; kept for the stats parsing below.
+                summary_lines.append(line)
+        del ping_results[idx:]
+        proc.wait()
+        stderr_data = proc.stderr.read()
+        end_time = time.monotonic()
         test_duration = end_time - start_time
 
-        output = result.stdout
-        error = result.stderr if result.stderr else ""
-
-        # Parse individual ping results.
-        ping_results = []
-        for line in output.splitlines():
-            if "Reply from" in line:
-                # Look for reply time values which may be integers or decimals
-                match_time = REPLY_TIME_PATTERN.search(line)
-                if match_time:
-                    ping_results.append(float(match_time.group(1)))
-                else:
-                    ping_results.append(None)
-            elif "Request timed out" in line:
-                ping_results.append(None)
+        output = b"".join(summary_lines)
+        error = stderr_data.decode("ascii", errors="replace") if stderr_data else ""
+
         valid_times = [pt for pt in ping_results if pt is not None]
-        
-        # Calculate jitter from consecutive valid ping times.
-        if len(valid_times) > 1:
-            jitter = sum(abs(valid_times[i+1] - valid_times[i]) for i in range(len(valid_times) - 1)) / (len(valid_times) - 1)
-        else:
-            jitter = 0
+
+        # Jitter always comes from the individual times; the RTT stats are
+        # only needed when the summary lines below are missing.
+        jitter, stat_min, stat_max, stat_avg = _ping_stats(valid_times)
 
         # Extract summary packet counts.
-        match_counts = PACKET_COUNT_PATTERN.search(output)
+        match_counts = PACKET_COUNT_PATTERN_BYTES.search(output)
         if match_counts:
             sent = int(match_counts.group(1))
             received = int(match_counts.group(2))
@@ -367,22 +995,17 @@ def ping_test() -> PingResult:
             loss_percent = (lost / COUNT) * 100
 
         # Extract round-trip time statistics.
-        match_times = RTT_STATS_PATTERN.search(output)
+        match_times = RTT_STATS_PATTERN_BYTES.search(output)
         if match_times:
             min_time = int(match_times.group(1))
             max_time = int(match_times.group(2))
             avg_time = int(match_times.group(3))
         else:
-            if valid_times:
-                # When RTT summary lines are missing, derive statistics from
-                # the collected ping times which may be floats.
-                min_time = int(min(valid_times))
-                max_time = int(max(valid_times))
-                avg_time = int(sum(valid_times) / len(valid_times))
-            else:
-                min_time = max_time = avg_time = None
+            # When RTT summary lines are missing, fall back to the
+            # statistics derived from the collected ping times.
+            min_time, max_time, avg_time = stat_min, stat_max, stat_avg
 
-        connected = received > 0
+        connected = connected or received > 0
 
         return PingResult(
             connected=connected,
@@ -399,13 +1022,14 @@ def ping_test() -> PingResult:
             error=error
         )
     except Exception as e:
-        end_time = time.time()
+        end_time = time.monotonic()
         test_duration = end_time - start_time
-        # Capture full traceback for debugging.
-        error_message = traceback.format_exc()
-        # Log the error traceback to the separate error log.
-        with open(ERROR_LOG, "a") as err_log:
-            err_log.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error in ping_test:\n{error_message}\n")
+        # The full traceback (a Python-level walk of the frame stack) is
+        # only formatted for the error log; the returned error field
+        # carries just the exception line, which also keeps the log
+        # entry for this test on a single line.
+        error_message = "".join(traceback.format_exception_only(type(e), e)).strip()
+        _log_error(f"Error in ping_test:\n{traceback.format_exc()}")
         return PingResult(
             connected=False,
             loss_percent=100.0,
@@ -421,10 +1045,92 @@ def ping_test() -> PingResult:
             error=error_message
         )
 
-def log_status(log_all: LogManager, log_fail: LogManager, result: PingResult):
+def _fmt_connected(result: PingResult, timestamp: str) -> str:
     """
-    Creates and writes detailed log entries for ping test results.
-    
+    Formats the hot-path log entry: connected, RTT stats present, no error.
+
+    A single f-string with no conditionals, so the common case compiles
+    to a straight formatting sequence.
+
+    Args:
+        result (PingResult): Complete results from the ping test
+        timestamp (str): Wall-clock timestamp for the entry
+
+    Returns:
+        str: The complete log entry including trailing newline
+    """
+    return (
+        f"{timestamp} - Connected: {result.loss_percent:.1f}% packet loss (Sent: {result.sent}, Received: {result.received}, Lost: {result.lost})"
+        f" Min: {result.min_time}ms, Max: {result.max_time}ms, Avg: {result.avg_time}ms"
+        f" | Jitter: {result.jitter:.1f}ms, Duration: {result.test_duration*1000:.1f}ms"
+        f" | Ping Results: [{', '.join(map(_fmt_ping, result.ping_results))}]\n"
+    )
+
+def _fmt_disconnected(result: PingResult, timestamp: str) -> str:
+    """
+    Formats the general log entry for failed or unusual results.
+
+    Handles every optional piece: missing RTT statistics, error text,
+    and the Disconnected status.
+
+    Args:
+        result (PingResult): Complete results from the ping test
+        timestamp (str): Wall-clock timestamp for the entry
+
+    Returns:
+        str: The complete log entry including trailing newline
+    """
+    status_str = "Connected" if result.connected else "Disconnected"
+    parts = [f"{timestamp} - {status_str}: {result.loss_percent:.1f}% packet loss (Sent: {result.sent}, Received: {result.received}, Lost: {result.lost})"]
+    if result.min_time is not None:
+        parts.append(f" Min: {result.min_time}ms, Max: {result.max_time}ms, Avg: {result.avg_time}ms")
+    parts.append(f" | Jitter: {result.jitter:.1f}ms, Duration: {result.test_duration*1000:.1f}ms")
+    parts.append(f" | Ping Results: [{', '.join(map(_fmt_ping, result.ping_results))}]")
+    if result.error:
+        parts.append(f" | Error: {result.error.strip()}")
+    if result.target:
+        parts.append(f" | Target: {result.target}")
+    parts.append("\n")
+    return "".join(parts)
+
+def _log_worker(log_queue: queue.SimpleQueue, log_all: LogManager, log_fail: LogManager):
+    """
+    Background thread that drains the log queue into the log files.
+
+    Runs until it pulls the None sentinel. Each wakeup drains up to
+    LOG_BATCH_SIZE queued entries before flushing both LogManagers, so a
+    burst of results costs one writelines() per file rather than one
+    write per entry -- and disk latency never stalls the ping loop.
+
+    Args:
+        log_queue (queue.SimpleQueue): Queue of (entry, connected) tuples
+        log_all (LogManager): Manager for the main log file
+        log_fail (LogManager): Manager for the connection failure log file
+    """
+    while True:
+        item = log_queue.get()
+        batched = 1
+        while item is not None:
+            entry, connected = item
+            log_all.write(entry)
+            if not connected:
+                log_fail.write(entry)
+            if batched >= LOG_BATCH_SIZE:
+                break
+            try:
+                item = log_queue.get_nowait()
+                batched += 1
+            except queue.Empty:
+                break
+        log_all.flush_pending()
+        log_fail.flush_pending()
+        if item is None:
+            return
+
+def log_status(log_queue: queue.SimpleQueue, result: PingResult):
+    """
+    Creates a detailed log entry for a ping test result and queues it.
+
     Formats a comprehensive log entry including:
     - Timestamp
     - Connection status
@@ -434,32 +1140,32 @@ def log_status(log_all: LogManager, log_fail: LogManager, result: PingResult):
     - Test duration
     - Individual ping results
     - Any errors encountered
-    
-    The entry is written to the main log file and printed to console.
-    If the connection failed, it's also written to the failure log.
-    
+
+    The entry is printed to console and handed to the background writer
+    thread, which appends it to the main log file (and to the failure
+    log when the connection was down) off the ping hot path.
+
     Args:
-        log_all (LogManager): Manager for the main log file
-        log_fail (LogManager): Manager for the connection failure log file
+        log_queue (queue.SimpleQueue): Queue consumed by _log_worker
         result (PingResult): Complete results from the ping test
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
-    status_str = "Connected" if result.connected else "Disconnected"
-    
-    entry = f"{timestamp} - {status_str}: {result.loss_percent:.1f}% packet loss (Sent: {result.sent}, Received: {result.received}, Lost: {result.lost})"
-    if result.min_time is not None:
-        entry += f" Min: {result.min_time}ms, Max: {result.max_time}ms, Avg: {result.avg_time}ms"
-    entry += f" | Jitter: {result.jitter:.1f}ms, Duration: {result.test_duration*1000:.1f}ms"
-    results_str = ", ".join(str(x) if x is not None else "timeout" for x in result.ping_results)
-    entry += f" | Ping Results: [{results_str}]"
-    if result.error:
-        entry += f" | Error: {result.error.strip()}"
-    entry += "\n"
+    timestamp = _log_timestamp()
+    # Dispatch once: the overwhelmingly common connected/no-error case
+    # gets a branch-free single-f-string formatter; everything else goes
+    # through the general conditional builder.
+    if (result.connected and not result.error and not result.target
+            and result.min_time is not None):
+        fmt = _fmt_connected
+    else:
+        fmt = _fmt_disconnected
+    entry = fmt(result, timestamp)
 
-    log_all.write(entry)
     print(entry)
-    if not result.connected:
-        log_fail.write(entry)
+    # Encode once here so the writer thread and both LogManagers handle
+    # ready-to-write bytes. Replace rather than raise: error text can
+    # carry non-ASCII characters (localized strerror, the U+FFFD marks
+    # from decoding ping's stderr) and must not kill the monitor.
+    log_queue.put((entry.encode("ascii", errors="replace"), result.connected))
 
 def main():
     """
@@ -480,27 +1186,53 @@ def main():
     - An unhandled error occurs
     """
     duration_minutes = get_test_duration()
-    start_time = time.time()
+    start_time = time.monotonic()
     
+    global _error_log
     log_all = LogManager(ALL_ATTEMPTS_LOG)
     log_fail = LogManager(LOST_CONNECTION_LOG)
-    
+    _error_log = LogManager(ERROR_LOG)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    writer = threading.Thread(
+        target=_log_worker, args=(log_queue, log_all, log_fail), daemon=True)
+    writer.start()
+
     try:
+        # Deadline-based schedule: each iteration advances the deadline by
+        # DESIRED_INTERVAL and sleeps until it, so the cadence stays fixed
+        # instead of drifting by however long each test happened to take.
+        deadline = time.monotonic()
         while True:
             # Check if we've exceeded the duration
             if duration_minutes is not None:
-                elapsed_minutes = (time.time() - start_time) / 60
+                elapsed_minutes = (time.monotonic() - start_time) / 60
                 if elapsed_minutes >= duration_minutes:
                     print(f"\nTest completed after {elapsed_minutes:.1f} minutes.")
                     break
-            
-            result = ping_test()
-            log_status(log_all, log_fail, result)
-            sleep_time = max(0, DESIRED_INTERVAL - result.test_duration)
-            time.sleep(sleep_time)
+
+            for result in ping_test_all():
+                log_status(log_queue, result)
+            deadline += DESIRED_INTERVAL
+            sleep_time = deadline - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                # The test overran its slot; restart the schedule from now
+                # rather than racing to catch up on missed deadlines.
+                deadline = time.monotonic()
     finally:
+        # Stop the writer thread so every queued entry reaches disk
+        # before the log files are closed.
+        log_queue.put(None)
+        writer.join(timeout=5)
         log_all.close()
         log_fail.close()
+        _error_log.close()
+        _error_log = None
+        if _ping_stream is not None:
+            _ping_stream.close()
+        if _win_icmp is not None:
+            _win_icmp.close()
 
 if __name__ == '__main__':
     try: